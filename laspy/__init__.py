@@ -13,6 +13,7 @@ from .lib import DecompressionSelection, LazBackend, convert
 from .lib import create_las as create
 from .lib import mmap_las as mmap
 from .lib import open_las as open
+from .lib import read_headers
 from .lib import read_las as read
 from .point import DimensionInfo, DimensionKind, ExtraBytesParams, PointFormat
 from .point.dims import supported_point_formats, supported_versions
@@ -0,0 +1,47 @@
+"""
+Optional numba-accelerated kernels for the header statistics.
+
+When numba is installed, :func:`update_stats` is compiled and folds the
+X, Y, Z extremums and the return number histogram in a single loop over
+the columns, instead of one numpy reduction per statistic.
+
+When numba is not installed, ``update_stats`` is None and callers
+fall back to their pure numpy path.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ModuleNotFoundError:
+    update_stats = None
+else:
+
+    @numba.njit(cache=True, nogil=True)
+    def update_stats(x, y, z, return_numbers, num_returns):
+        """Computes the min, max of x, y, z and the histogram of the
+        return numbers in a single pass.
+
+        Returns (mins, maxs, counts) where mins and maxs hold the
+        extremums of x, y, z (in raw integer coordinates) and
+        counts[i] is the number of points with return number i + 1.
+        Return number 0 and return numbers > num_returns are ignored.
+
+        nogil=True so that callers may process chunks from a thread pool.
+        """
+        mins = np.empty(3, x.dtype)
+        maxs = np.empty(3, x.dtype)
+        mins[0], mins[1], mins[2] = x[0], y[0], z[0]
+        maxs[0], maxs[1], maxs[2] = x[0], y[0], z[0]
+        counts = np.zeros(num_returns, dtype=np.uint64)
+        for i in range(len(x)):
+            mins[0] = min(mins[0], x[i])
+            mins[1] = min(mins[1], y[i])
+            mins[2] = min(mins[2], z[i])
+            maxs[0] = max(maxs[0], x[i])
+            maxs[1] = max(maxs[1], y[i])
+            maxs[2] = max(maxs[2], z[i])
+            return_number = return_numbers[i]
+            if 0 < return_number <= num_returns:
+                counts[return_number - 1] += 1
+        return mins, maxs, counts
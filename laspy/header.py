@@ -15,11 +15,12 @@ from ._compression.format import (
     is_point_format_compressed,
     uncompressed_id_to_compressed,
 )
+from ._header_kernels import update_stats
 from .errors import LaspyException
 from .point import dims
 from .point.format import ExtraBytesParams, PointFormat
 from .point.record import PackedPointRecord
-from .utils import read_string, write_string
+from .utils import decode_string, get_bytes_from_string
 from .vlrs import VLR
 from .vlrs.geotiff import create_geotiff_projection_vlrs
 from .vlrs.known import (
@@ -37,6 +38,10 @@ GENERATING_SOFTWARE_LEN = 32
 SYSTEM_IDENTIFIER_LEN = 32
 
 LAS_FILE_SIGNATURE = b"LASF"
+
+# Cached structs for the few fields that are read/written individually
+UNSIGNED_INT16 = struct.Struct("<H")
+UNSIGNED_INT32 = struct.Struct("<I")
 DEFAULT_GENERATING_SOFTWARE = f"laspy {__version__}"
 assert len(DEFAULT_GENERATING_SOFTWARE) < GENERATING_SOFTWARE_LEN
 
@@ -72,20 +77,15 @@ class GlobalEncoding:
     SYNTHETIC_RETURN_NUMBERS_MASK = 0b0000_0000_0000_1000  # 1.3
     WKT_MASK = 0b0000_0000_0001_0000  # 1.4
 
+    __slots__ = ("value",)
+
     def __init__(self, value=0):
         self.value = value
 
-    def _set_bit(self, mask):
-        self.value |= mask
-
-    def _unset_bit(self, mask):
-        self.value ^= mask
-
     def _set_if_true(self, mask, value):
-        if bool(value) is True:
-            self._set_bit(mask)
-        else:
-            self._unset_bit(mask)
+        # Branchless masked assignment, this also properly
+        # leaves the bit clear when it already was
+        self.value = (self.value & ~mask) | (mask if value else 0)
 
     @property
     def gps_time_type(self) -> GpsTimeType:
@@ -93,8 +93,9 @@ class GlobalEncoding:
 
     @gps_time_type.setter
     def gps_time_type(self, value: GpsTimeType):
-        self.value ^= self.GPS_TIME_TYPE_MASK
-        self.value |= int(value) & self.GPS_TIME_TYPE_MASK
+        self.value = (self.value & ~self.GPS_TIME_TYPE_MASK) | (
+            int(value) & self.GPS_TIME_TYPE_MASK
+        )
 
     @property
     def waveform_data_packets_internal(self) -> bool:
@@ -130,10 +131,33 @@ class GlobalEncoding:
 
     @classmethod
     def read_from(cls, stream: BinaryIO) -> "GlobalEncoding":
-        return cls(int.from_bytes(stream.read(2), byteorder="little", signed=False))
+        return cls(UNSIGNED_INT16.unpack(stream.read(2))[0])
 
     def write_to(self, stream: BinaryIO) -> None:
-        stream.write(self.value.to_bytes(2, byteorder="little", signed=False))
+        stream.write(UNSIGNED_INT16.pack(self.value))
+
+
+class _ArrayComponent:
+    """Descriptor exposing one element of one of the header's 3-element
+    arrays (scales, offsets, maxs, mins) as a scalar attribute.
+
+    Reads return a plain Python float, avoiding the numpy scalar boxing
+    of a property that indexes into the array.
+    """
+
+    __slots__ = ("array_name", "index")
+
+    def __init__(self, array_name: str, index: int) -> None:
+        self.array_name = array_name
+        self.index = index
+
+    def __get__(self, instance, owner=None) -> float:
+        if instance is None:
+            return self
+        return float(getattr(instance, self.array_name)[self.index])
+
+    def __set__(self, instance, value: float) -> None:
+        getattr(instance, self.array_name)[self.index] = value
 
 
 class LasHeader:
@@ -210,12 +234,13 @@ class LasHeader:
         #: Initialized to null UUID
         self.uuid: UUID = UUID(bytes_le=b"\0" * 16)
         self._version: Version = version
+        self._version_str: str = str(version)
         #: System identifier
         #: Initialized to 'OTHER'
-        self.system_identifier: Union[str, bytes] = "OTHER"
+        self.system_identifier = "OTHER"
         #: The software which generated the file
         #: Initialized to 'laspy'
-        self.generating_software: Union[str, bytes] = DEFAULT_GENERATING_SOFTWARE
+        self.generating_software = DEFAULT_GENERATING_SOFTWARE
         self._point_format: PointFormat = point_format
         #: Day the file was created, initialized to date.today
         self.creation_date: Optional[date] = date.today()
@@ -232,15 +257,19 @@ class LasHeader:
 
         #: Number of points by return
         #: for las <= 1.2 only the first 5 elements matters
-        self.number_of_points_by_return: np.ndarray = np.zeros(15, dtype=np.uint32)
+        self.number_of_points_by_return: np.ndarray = np.zeros(15, dtype=np.uint64)
 
         #: The VLRS
         self._vlrs: VLRList = VLRList()
 
+        #: Raw bytes (and count) of VLRs whose parsing was deferred by
+        #: read_from, None once parsed (or when nothing was deferred)
+        self._raw_vlr_block: Optional[typing.Tuple[bytes, int]] = None
+
         #: Extra bytes between end of header and first vlrs
         self.extra_header_bytes: bytes = b""
         #: Extra bytes between end of vlr end first point
-        self.extra_vlr_bytes: bytes = b""
+        self.extra_vlr_bytes = b""
 
         #: Las >= 1.3
         self.start_of_waveform_data_packet_record: int = 0
@@ -271,11 +300,63 @@ class LasHeader:
     @point_format.setter
     def point_format(self, new_point_format: PointFormat) -> None:
         dims.raise_if_version_not_compatible_with_fmt(
-            new_point_format.id, str(self.version)
+            new_point_format.id, self._version_str
         )
         self._point_format = new_point_format
         self._sync_extra_bytes_vlr()
 
+    @property
+    def system_identifier(self) -> Union[str, bytes]:
+        """The system identifier"""
+        if self._system_identifier is None:
+            # Decoding of the field read from a file was deferred
+            self._system_identifier = decode_string(self._system_identifier_bytes)
+        return self._system_identifier
+
+    @system_identifier.setter
+    def system_identifier(self, value: Union[str, bytes]) -> None:
+        self._system_identifier = value
+        self._system_identifier_bytes = self._encode_header_string(
+            value, SYSTEM_IDENTIFIER_LEN, "system identifier"
+        )
+
+    @property
+    def generating_software(self) -> Union[str, bytes]:
+        """The software which generated the file"""
+        if self._generating_software is None:
+            # Decoding of the field read from a file was deferred
+            self._generating_software = decode_string(self._generating_software_bytes)
+        return self._generating_software
+
+    @generating_software.setter
+    def generating_software(self, value: Union[str, bytes]) -> None:
+        self._generating_software = value
+        self._generating_software_bytes = self._encode_header_string(
+            value, GENERATING_SOFTWARE_LEN, "generating software"
+        )
+
+    @staticmethod
+    def _encode_header_string(
+        value: Union[str, bytes], max_length: int, display_name: str
+    ) -> Optional[bytes]:
+        """Encodes (and truncates if needed) one of the header's string
+        fields, so that write_to only has to copy the cached bytes.
+
+        Returns None if the value is not strictly ascii-encodable,
+        in which case the encoding is re-attempted at write time with the
+        caller's encoding_errors.
+        """
+        try:
+            raw_bytes = get_bytes_from_string(value, "ascii", "strict")
+        except UnicodeError:
+            return None
+        if len(raw_bytes) > max_length:
+            logger.warning(
+                f"{display_name} does not fit into the {max_length} maximum bytes,"
+                f" it will be truncated"
+            )
+        return raw_bytes[:max_length]
+
     @property
     def version(self) -> Version:
         """The version"""
@@ -283,118 +364,53 @@ class LasHeader:
 
     @version.setter
     def version(self, version: Version) -> None:
-        dims.raise_if_version_not_compatible_with_fmt(
-            self.point_format.id, str(version)
-        )
+        version_str = str(version)
+        dims.raise_if_version_not_compatible_with_fmt(self.point_format.id, version_str)
         self._version = version
+        self._version_str = version_str
 
     # scale properties
-    @property
-    def x_scale(self) -> float:
-        return self.scales[0]
-
-    @x_scale.setter
-    def x_scale(self, value: float) -> None:
-        self.scales[0] = value
-
-    @property
-    def y_scale(self) -> float:
-        return self.scales[1]
-
-    @y_scale.setter
-    def y_scale(self, value: float) -> None:
-        self.scales[1] = value
-
-    @property
-    def z_scale(self) -> float:
-        return self.scales[2]
-
-    @z_scale.setter
-    def z_scale(self, value: float) -> None:
-        self.scales[2] = value
+    x_scale = _ArrayComponent("scales", 0)
+    y_scale = _ArrayComponent("scales", 1)
+    z_scale = _ArrayComponent("scales", 2)
 
     # offset properties
-    @property
-    def x_offset(self) -> float:
-        return self.offsets[0]
-
-    @x_offset.setter
-    def x_offset(self, value: float) -> None:
-        self.offsets[0] = value
-
-    @property
-    def y_offset(self) -> float:
-        return self.offsets[1]
-
-    @y_offset.setter
-    def y_offset(self, value: float) -> None:
-        self.offsets[1] = value
-
-    @property
-    def z_offset(self) -> float:
-        return self.offsets[2]
-
-    @z_offset.setter
-    def z_offset(self, value: float) -> None:
-        self.offsets[2] = value
+    x_offset = _ArrayComponent("offsets", 0)
+    y_offset = _ArrayComponent("offsets", 1)
+    z_offset = _ArrayComponent("offsets", 2)
 
     # max properties
-    @property
-    def x_max(self) -> float:
-        return self.maxs[0]
-
-    @x_max.setter
-    def x_max(self, value: float) -> None:
-        self.maxs[0] = value
-
-    @property
-    def y_max(self) -> float:
-        return self.maxs[1]
-
-    @y_max.setter
-    def y_max(self, value: float) -> None:
-        self.maxs[1] = value
-
-    @property
-    def z_max(self) -> float:
-        return self.maxs[2]
-
-    @z_max.setter
-    def z_max(self, value: float) -> None:
-        self.maxs[2] = value
+    x_max = _ArrayComponent("maxs", 0)
+    y_max = _ArrayComponent("maxs", 1)
+    z_max = _ArrayComponent("maxs", 2)
 
     # min properties
-    @property
-    def x_min(self) -> float:
-        return self.mins[0]
-
-    @x_min.setter
-    def x_min(self, value: float) -> None:
-        self.mins[0] = value
+    x_min = _ArrayComponent("mins", 0)
+    y_min = _ArrayComponent("mins", 1)
+    z_min = _ArrayComponent("mins", 2)
 
     @property
-    def y_min(self) -> float:
-        return self.mins[1]
-
-    @y_min.setter
-    def y_min(self, value: float) -> None:
-        self.mins[1] = value
-
-    @property
-    def z_min(self) -> float:
-        return self.mins[2]
-
-    @z_min.setter
-    def z_min(self, value: float) -> None:
-        self.mins[2] = value
+    def extra_vlr_bytes(self) -> bytes:
+        """Extra bytes between the end of the vlrs and the first point"""
+        self._materialize_vlrs()
+        return self._extra_vlr_bytes
+
+    @extra_vlr_bytes.setter
+    def extra_vlr_bytes(self, value: bytes) -> None:
+        # Materialize first, otherwise a later parsing of the deferred
+        # VLR block would overwrite the caller's value
+        self._materialize_vlrs()
+        self._extra_vlr_bytes = value
 
     @property
     def vlrs(self) -> VLRList:
+        self._materialize_vlrs()
         return self._vlrs
 
     @vlrs.setter
     def vlrs(self, vlrs: typing.Iterable[VLR]) -> None:
         self._vlrs = VLRList(vlrs)
+        self._raw_vlr_block = None
 
         try:
             self.vlrs.extract("LaszipVlr")
@@ -430,6 +446,7 @@ class LasHeader:
         import pyproj
 
         # check and remove any existing crs vlrs
+        vlrs = self.vlrs
         for crs_vlr_name in (
             "WktCoordinateSystemVlr",
             "GeoKeyDirectoryVlr",
@@ -437,7 +454,7 @@ class LasHeader:
             "GeoDoubleParamsVlr",
         ):
             try:
-                self._vlrs.extract(crs_vlr_name)
+                vlrs.extract(crs_vlr_name)
             except IndexError:
                 pass
 
@@ -445,10 +462,10 @@ class LasHeader:
         new_pt = self.point_format.id >= 6
 
         if new_pt or (new_ver and not keep_compatibility):
-            self._vlrs.append(WktCoordinateSystemVlr(crs.to_wkt()))
+            vlrs.append(WktCoordinateSystemVlr(crs.to_wkt()))
             self.global_encoding.wkt = True
         else:
-            self._vlrs.extend(create_geotiff_projection_vlrs(crs))
+            vlrs.extend(create_geotiff_projection_vlrs(crs))
 
     def remove_extra_dim(self, name: str) -> None:
         self.remove_extra_dims([name])
@@ -461,8 +478,10 @@ class LasHeader:
     def set_version_and_point_format(
         self, version: Version, point_format: PointFormat
     ) -> None:
-        dims.raise_if_version_not_compatible_with_fmt(point_format.id, str(version))
+        version_str = str(version)
+        dims.raise_if_version_not_compatible_with_fmt(point_format.id, version_str)
         self._version = version
+        self._version_str = version_str
         self.point_format = point_format
 
     def partial_reset(self) -> None:
@@ -473,50 +492,57 @@ class LasHeader:
         self.start_of_first_evlr = 0
         self.number_of_evlrs = 0
         self.point_count = 0
-        self.number_of_points_by_return = np.zeros(15, dtype=np.uint32)
+        self.number_of_points_by_return = np.zeros(15, dtype=np.uint64)
 
     def update(self, points: PackedPointRecord) -> None:
         self.partial_reset()
         if not points:
-            self.maxs = [0.0, 0.0, 0.0]
-            self.mins = [0.0, 0.0, 0.0]
+            self.maxs = np.zeros(3, dtype=np.float64)
+            self.mins = np.zeros(3, dtype=np.float64)
         else:
             self.grow(points)
 
     def grow(self, points: PackedPointRecord) -> None:
-        self.x_max = max(
-            self.x_max,
-            (points["X"].max() * self.x_scale) + self.x_offset,
-        )
-        self.y_max = max(
-            self.y_max,
-            (points["Y"].max() * self.y_scale) + self.y_offset,
-        )
-        self.z_max = max(
-            self.z_max,
-            (points["Z"].max() * self.z_scale) + self.z_offset,
-        )
-        self.x_min = min(
-            self.x_min,
-            (points["X"].min() * self.x_scale) + self.x_offset,
-        )
-        self.y_min = min(
-            self.y_min,
-            (points["Y"].min() * self.y_scale) + self.y_offset,
-        )
-        self.z_min = min(
-            self.z_min,
-            (points["Z"].min() * self.z_scale) + self.z_offset,
-        )
+        num_returns = len(self.number_of_points_by_return)
+        if update_stats is not None and len(points) > 0:
+            mins, maxs, counts = update_stats(
+                points["X"],
+                points["Y"],
+                points["Z"],
+                np.asarray(points.return_number),
+                num_returns,
+            )
+            np.minimum(self.mins, (mins * self.scales) + self.offsets, out=self.mins)
+            np.maximum(self.maxs, (maxs * self.scales) + self.offsets, out=self.maxs)
+        else:
+            # Gather the 6 extremums in numpy space and apply
+            # scale/offset with two vector ops, rather than boxing each
+            # reduction into a Python float and comparing one by one.
+            col_mins = np.empty(3, np.float64)
+            col_maxs = np.empty(3, np.float64)
+            for i, name in enumerate(("X", "Y", "Z")):
+                column = points[name]
+                col_mins[i] = column.min()
+                col_maxs[i] = column.max()
+            np.minimum(
+                self.mins, (col_mins * self.scales) + self.offsets, out=self.mins
+            )
+            np.maximum(
+                self.maxs, (col_maxs * self.scales) + self.offsets, out=self.maxs
+            )
 
-        for return_number, count in zip(
-            *np.unique(points.return_number, return_counts=True)
-        ):
-            if return_number == 0:
-                continue
-            if return_number > len(self.number_of_points_by_return):
-                break  # np.unique sorts unique values
-            self.number_of_points_by_return[return_number - 1] += count
+            # A histogram is O(n) while np.unique sorts the whole column.
+            # Return number 0 and return numbers too big
+            # for the header are ignored.
+            counts = np.bincount(points.return_number, minlength=num_returns + 1)
+            counts = counts[1 : num_returns + 1]
+
+        np.add(
+            self.number_of_points_by_return,
+            counts,
+            out=self.number_of_points_by_return,
+            casting="unsafe",
+        )
         self.point_count += len(points)
 
     def set_compressed(self, state: bool) -> None:
@@ -541,7 +567,6 @@ class LasHeader:
         (regardless of is read_evlrs was true)
 
         """
-        little_endian = "little"
         header = cls()
 
         stream = io.BytesIO(cls._prefetch_header_data(original_stream))
@@ -550,72 +575,63 @@ class LasHeader:
         # This should not be possible as _prefetch already checks this
         assert file_sig == LAS_FILE_SIGNATURE
 
-        header.file_source_id = int.from_bytes(
-            stream.read(2), little_endian, signed=False
-        )
-        header.global_encoding = GlobalEncoding.read_from(stream)
-
-        header.uuid = UUID(bytes_le=stream.read(16))
-        header._version = Version(
-            int.from_bytes(stream.read(1), little_endian, signed=False),
-            int.from_bytes(stream.read(1), little_endian, signed=False),
-        )
+        # The fixed-layout part of the header is decoded in a single
+        # np.frombuffer call instead of many small reads, its fields
+        # are then copied into the header's attributes.
+        rec = np.frombuffer(
+            stream.read(LAS_HEADER_12_DTYPE.itemsize), dtype=LAS_HEADER_12_DTYPE
+        )[0]
+
+        header.file_source_id = int(rec["file_source_id"])
+        header.global_encoding = GlobalEncoding(int(rec["global_encoding"]))
+
+        header.uuid = UUID(bytes_le=bytes(rec["uuid"]))
+        header._version = Version(int(rec["version_major"]), int(rec["version_minor"]))
+        header._version_str = str(header._version)
+
+        # The raw bytes are kept as the pre-encoded form used when
+        # writing, and are only decoded to str if the attribute is read.
+        # Values that are not plain ascii go through the setter so that
+        # writing them keeps validating the encoding.
+        system_identifier = bytes(rec["system_identifier"]).split(b"\0", 1)[0]
+        if system_identifier.isascii():
+            header._system_identifier = None
+            header._system_identifier_bytes = system_identifier
+        else:
+            header.system_identifier = decode_string(system_identifier)
 
-        header.system_identifier = read_string(stream, SYSTEM_IDENTIFIER_LEN)
-        header.generating_software = read_string(stream, GENERATING_SOFTWARE_LEN)
+        generating_software = bytes(rec["generating_software"]).split(b"\0", 1)[0]
+        if generating_software.isascii():
+            header._generating_software = None
+            header._generating_software_bytes = generating_software
+        else:
+            header.generating_software = decode_string(generating_software)
 
-        creation_day_of_year = int.from_bytes(
-            stream.read(2), little_endian, signed=False
-        )
-        creation_year = int.from_bytes(stream.read(2), little_endian, signed=False)
         try:
-            header.creation_date = date(creation_year, 1, 1) + timedelta(
-                creation_day_of_year - 1
+            header.creation_date = date(int(rec["creation_year"]), 1, 1) + timedelta(
+                int(rec["creation_day_of_year"]) - 1
             )
         except ValueError:
             header.creation_date = None
 
-        header_size = int.from_bytes(stream.read(2), little_endian, signed=False)
-        header.offset_to_point_data = int.from_bytes(
-            stream.read(4), little_endian, signed=False
-        )
-        number_of_vlrs = int.from_bytes(stream.read(4), little_endian, signed=False)
+        header_size = int(rec["header_size"])
+        header.offset_to_point_data = int(rec["offset_to_point_data"])
+        number_of_vlrs = int(rec["number_of_vlrs"])
 
-        point_format_id = int.from_bytes(stream.read(1), little_endian, signed=False)
-        point_size = int.from_bytes(stream.read(2), little_endian, signed=False)
+        point_format_id = int(rec["point_format_id"])
+        point_size = int(rec["point_size"])
 
-        header.point_count = int.from_bytes(stream.read(4), little_endian, signed=False)
-        for i in range(5):
-            header.number_of_points_by_return[i] = int.from_bytes(
-                stream.read(4), little_endian, signed=False
-            )
+        header.point_count = int(rec["point_count"])
+        header.number_of_points_by_return[:5] = rec["number_of_points_by_return"]
 
-        for i in range(3):
-            header.scales[i] = struct.unpack("<d", stream.read(8))[0]
-        for i in range(3):
-            header.offsets[i] = struct.unpack("<d", stream.read(8))[0]
-        for i in range(3):
-            header.maxs[i] = struct.unpack("<d", stream.read(8))[0]
-            header.mins[i] = struct.unpack("<d", stream.read(8))[0]
-
-        if header.version.minor >= 3:
-            header.start_of_waveform_data_packet_record = int.from_bytes(
-                stream.read(8), little_endian, signed=False
-            )
-        if header.version.minor >= 4:
-            header.start_of_first_evlr = int.from_bytes(
-                stream.read(8), little_endian, signed=False
-            )
-            header.number_of_evlrs = int.from_bytes(
-                stream.read(4), little_endian, signed=False
-            )
-            header.point_count = int.from_bytes(
-                stream.read(8), little_endian, signed=False
-            )
-            for i in range(15):
-                header.number_of_points_by_return[i] = int.from_bytes(
-                    stream.read(8), little_endian, signed=False
-                )
+        header.scales[:] = rec["scales"]
+        header.offsets[:] = rec["offsets"]
+        header.maxs[:] = rec["max_min"][0::2]
+        header.mins[:] = rec["max_min"][1::2]
+
+        read_header_extensions = LAS_HEADER_EXTENSION_READERS.get(header._version_str)
+        if read_header_extensions is not None:
+            read_header_extensions(header, stream)
 
         current_pos = stream.tell()
         if current_pos < header_size:
@@ -623,55 +639,59 @@ class LasHeader:
         elif current_pos > header_size:
             raise LaspyException("Incoherent header size")
 
-        header._vlrs = VLRList.read_from(stream, num_to_read=number_of_vlrs)
-
-        current_pos = stream.tell()
-        if current_pos < header.offset_to_point_data:
-            header.extra_vlr_bytes = stream.read(
-                header.offset_to_point_data - current_pos
-            )
-        elif current_pos > header.offset_to_point_data:
+        if stream.tell() > header.offset_to_point_data:
             raise LaspyException("Incoherent offset to point data")
 
         header.are_points_compressed = is_point_format_compressed(point_format_id)
         point_format_id = compressed_id_to_uncompressed(point_format_id)
         point_format = PointFormat(point_format_id)
-        try:
-            extra_bytes_vlr = typing.cast(
-                ExtraBytesVlr, header._vlrs.get("ExtraBytesVlr")[0]
+        header._point_format = point_format
+
+        if point_size == point_format.size:
+            # The point format is complete without looking at the VLRs,
+            # defer their parsing until they are actually queried.
+            # (A spurious ExtraBytesVlr is dropped at materialization time)
+            header._raw_vlr_block = (
+                stream.read(header.offset_to_point_data - stream.tell()),
+                number_of_vlrs,
             )
-        except IndexError:
-            pass
         else:
-            if point_size == point_format.size:
-                logger.warning(
-                    "There is an ExtraByteVlr but the header.point_size matches the "
-                    "point size without extra bytes. The extra bytes vlr info will be ignored"
+            header._vlrs = VLRList.read_from(stream, num_to_read=number_of_vlrs)
+
+            current_pos = stream.tell()
+            if current_pos < header.offset_to_point_data:
+                header.extra_vlr_bytes = stream.read(
+                    header.offset_to_point_data - current_pos
+                )
+
+            try:
+                extra_bytes_vlr = typing.cast(
+                    ExtraBytesVlr, header._vlrs.get("ExtraBytesVlr")[0]
                 )
-                header._vlrs.extract("ExtraBytesVlr")
+            except IndexError:
+                pass
             else:
                 for extra_dim_info in extra_bytes_vlr.type_of_extra_dims():
                     point_format.add_extra_dimension(extra_dim_info)
-        header._point_format = point_format
 
-        if point_size > point_format.size:
-            # We have unregistered extra bytes
-            num_extra_bytes = point_size - point_format.size
-            point_format.dimensions.append(
-                dims.DimensionInfo(
-                    name="ExtraBytes",
-                    kind=dims.DimensionKind.UnsignedInteger,
-                    num_bits=8 * num_extra_bytes,
-                    num_elements=num_extra_bytes,
-                    is_standard=False,
-                    description="Un-registered ExtraBytes",
+            if point_size > point_format.size:
+                # We have unregistered extra bytes
+                num_extra_bytes = point_size - point_format.size
+                point_format.dimensions.append(
+                    dims.DimensionInfo(
+                        name="ExtraBytes",
+                        kind=dims.DimensionKind.UnsignedInteger,
+                        num_bits=8 * num_extra_bytes,
+                        num_elements=num_extra_bytes,
+                        is_standard=False,
+                        description="Un-registered ExtraBytes",
+                    )
+                )
+            elif point_size < point_format.size:
+                raise LaspyException(
+                    f"Incoherent point size, "
+                    f"header says {point_size} point_format created says {point_format.size}"
                 )
-            )
-        elif point_size < point_format.size:
-            raise LaspyException(
-                f"Incoherent point size, "
-                f"header says {point_size} point_format created says {point_format.size}"
-            )
 
         if read_evlrs:
             header.read_evlrs(original_stream)
@@ -697,12 +717,15 @@ class LasHeader:
                 f" {self.max_point_count()} points (current: {self.point_count})"
             )
 
-        little_endian = "little"
+        self._materialize_vlrs()
+
+        # The VLRs are serialized once, the bytes serve both to compute
+        # the offset to point data and to be copied into the output.
         with io.BytesIO() as tmp:
             self._vlrs.write_to(tmp, encoding_errors=encoding_errors)
             vlr_bytes = tmp.getvalue()
 
-        header_size = LAS_HEADERS_SIZE[str(self.version)]
+        header_size = LAS_HEADERS_SIZE[self._version_str]
         header_size += len(self.extra_header_bytes)
         new_offset_to_data = header_size + len(vlr_bytes) + len(self.extra_vlr_bytes)
 
@@ -713,101 +736,88 @@ class LasHeader:
             )
         self.offset_to_point_data = new_offset_to_data
 
-        stream.write(LAS_FILE_SIGNATURE)
-        stream.write(self.file_source_id.to_bytes(2, little_endian, signed=False))
-        self.global_encoding.write_to(stream)
-        stream.write(self.uuid.bytes_le)
-        stream.write(self.version.major.to_bytes(1, little_endian, signed=False))
-        stream.write(self.version.minor.to_bytes(1, little_endian, signed=False))
-
-        was_truncated = write_string(
-            stream,
-            self.system_identifier,
-            SYSTEM_IDENTIFIER_LEN,
-            encoding_errors=encoding_errors,
-        )
-        if was_truncated:
-            logger.warning(
-                f"system identifier does not fit into the {SYSTEM_IDENTIFIER_LEN} maximum bytes,"
-                f" it will be truncated"
-            )
-
-        was_truncated = write_string(
-            stream,
-            self.generating_software,
-            GENERATING_SOFTWARE_LEN,
-            encoding_errors=encoding_errors,
-        )
-        if was_truncated:
-            logger.warning(
-                f"generating software does not fit into the {GENERATING_SOFTWARE_LEN} maximum bytes,"
-                f" it will be truncated"
-            )
+        # The fixed-layout part of the header is assembled into a single
+        # structured record and written in one call, the inverse of what
+        # read_from does.
+        rec = np.zeros(1, dtype=LAS_HEADER_12_DTYPE)[0]
+
+        rec["file_source_id"] = self.file_source_id
+        rec["global_encoding"] = self.global_encoding.value
+        rec["uuid"] = np.frombuffer(self.uuid.bytes_le, dtype="V16")[0]
+        rec["version_major"] = self.version.major
+        rec["version_minor"] = self.version.minor
+
+        system_identifier = self._system_identifier_bytes
+        if system_identifier is None:
+            system_identifier = get_bytes_from_string(
+                self.system_identifier, "ascii", encoding_errors
+            )[:SYSTEM_IDENTIFIER_LEN]
+        rec["system_identifier"] = system_identifier
+
+        generating_software = self._generating_software_bytes
+        if generating_software is None:
+            generating_software = get_bytes_from_string(
+                self.generating_software, "ascii", encoding_errors
+            )[:GENERATING_SOFTWARE_LEN]
+        rec["generating_software"] = generating_software
 
         if self.creation_date is None:
             self.creation_date = date.today()
 
-        stream.write(
-            self.creation_date.timetuple().tm_yday.to_bytes(
-                2, little_endian, signed=False
-            )
-        )
-        stream.write(self.creation_date.year.to_bytes(2, little_endian, signed=False))
+        rec["creation_day_of_year"] = self.creation_date.timetuple().tm_yday
+        rec["creation_year"] = self.creation_date.year
 
-        stream.write(header_size.to_bytes(2, little_endian, signed=False))
-        stream.write(self.offset_to_point_data.to_bytes(4, little_endian, signed=False))
-        stream.write(len(self._vlrs).to_bytes(4, little_endian, signed=False))
+        rec["header_size"] = header_size
+        rec["offset_to_point_data"] = self.offset_to_point_data
+        rec["number_of_vlrs"] = len(self._vlrs)
 
         point_format_id = self.point_format.id
         if self.are_points_compressed:
             point_format_id = uncompressed_id_to_compressed(point_format_id)
-        stream.write(point_format_id.to_bytes(1, little_endian, signed=False))
-        stream.write(self.point_format.size.to_bytes(2, little_endian, signed=False))
+        rec["point_format_id"] = point_format_id
+        rec["point_size"] = self.point_format.size
 
         # Point Count
-        if self.version.minor >= 4:
-            stream.write(int(0).to_bytes(4, little_endian, signed=False))
-            for i in range(5):
-                stream.write(int(0).to_bytes(4, little_endian, signed=False))
-        else:
-            stream.write(self.point_count.to_bytes(4, little_endian, signed=False))
-            for i in range(5):
-                stream.write(
-                    int(self.number_of_points_by_return[i]).to_bytes(
-                        4, little_endian, signed=False
-                    )
+        # The 'legacy' fields of a 1.4 header are zeroed
+        if self.version.minor < 4:
+            legacy_counts = self.number_of_points_by_return[:5]
+            if np.any(legacy_counts > np.iinfo(np.uint32).max):
+                raise LaspyException(
+                    f"Version {self.version} cannot save clouds with more than"
+                    f" {np.iinfo(np.uint32).max} points for a return number"
                 )
+            rec["point_count"] = self.point_count
+            rec["number_of_points_by_return"] = legacy_counts
 
-        for i in range(3):
-            stream.write(struct.pack("<d", self.scales[i]))
-        for i in range(3):
-            stream.write(struct.pack("<d", self.offsets[i]))
-        for i in range(3):
-            stream.write(struct.pack("<d", self.maxs[i]))
-            stream.write(struct.pack("<d", self.mins[i]))
+        rec["scales"] = self.scales
+        rec["offsets"] = self.offsets
+        rec["max_min"][0::2] = self.maxs
+        rec["max_min"][1::2] = self.mins
+
+        # The different parts are gathered in a single buffer
+        # so that only one write call is issued to the stream
+        buffer = bytearray(LAS_FILE_SIGNATURE)
+        buffer += rec.tobytes()
 
         if self.version.minor >= 3:
-            stream.write(
-                self.start_of_waveform_data_packet_record.to_bytes(
-                    8, little_endian, signed=False
-                )
-            )
+            rec = np.zeros(1, dtype=LAS_HEADER_13_EXTENSION_DTYPE)[0]
+            rec[
+                "start_of_waveform_data_packet_record"
+            ] = self.start_of_waveform_data_packet_record
+            buffer += rec.tobytes()
 
         if self.version.minor >= 4:
-            stream.write(
-                self.start_of_first_evlr.to_bytes(8, little_endian, signed=False)
-            )
-            stream.write(self.number_of_evlrs.to_bytes(4, little_endian, signed=False))
-            stream.write(self.point_count.to_bytes(8, little_endian, signed=False))
-            for i in range(15):
-                stream.write(
-                    int(self.number_of_points_by_return[i]).to_bytes(
-                        8, little_endian, signed=False
-                    )
-                )
-        stream.write(self.extra_header_bytes)
-        stream.write(vlr_bytes)
-        stream.write(self.extra_vlr_bytes)
+            rec = np.zeros(1, dtype=LAS_HEADER_14_EXTENSION_DTYPE)[0]
+            rec["start_of_first_evlr"] = self.start_of_first_evlr
+            rec["number_of_evlrs"] = self.number_of_evlrs
+            rec["point_count"] = self.point_count
+            rec["number_of_points_by_return"] = self.number_of_points_by_return
+            buffer += rec.tobytes()
+
+        buffer += self.extra_header_bytes
+        buffer += vlr_bytes
+        buffer += self.extra_vlr_bytes
+        stream.write(memoryview(buffer))
 
     def parse_crs(self, prefer_wkt=True) -> Optional["pyproj.CRS"]:
         """
@@ -830,7 +840,7 @@ class LasHeader:
             The ``prefer_wkt`` parameters.
         """
 
-        geo_vlr = self._vlrs.get_by_id("LASF_Projection")
+        geo_vlr = self.vlrs.get_by_id("LASF_Projection")
 
         if self.evlrs is not None:
             geo_vlr.extend(self.evlrs.get_by_id("LASF_Projection"))
@@ -909,19 +919,45 @@ class LasHeader:
         if len(header_bytes) < LAS_HEADERS_SIZE["1.1"]:
             raise LaspyException("File is to small to be a valid LAS")
 
-        offset_to_data = int.from_bytes(
-            header_bytes[96 : 96 + 4], byteorder="little", signed=False
-        )
+        offset_to_data = UNSIGNED_INT32.unpack_from(header_bytes, 96)[0]
 
         rest = source.read(offset_to_data - len(header_bytes))
 
         return header_bytes + rest
 
+    def _materialize_vlrs(self) -> None:
+        """Parses the VLRs whose raw bytes were kept aside by read_from.
+
+        Does nothing when there is nothing deferred, so it is safe
+        (and cheap) to call before any use of self._vlrs.
+        """
+        if self._raw_vlr_block is None:
+            return
+        raw_bytes, number_of_vlrs = self._raw_vlr_block
+        self._raw_vlr_block = None
+
+        stream = io.BytesIO(raw_bytes)
+        self._vlrs = VLRList.read_from(stream, num_to_read=number_of_vlrs)
+        self._extra_vlr_bytes = raw_bytes[stream.tell() :]
+
+        # The parsing was only deferred because header.point_size told us
+        # the points carry no extra bytes, so an ExtraBytesVlr found here
+        # does not match the points and is dropped, exactly as an eager
+        # parse would have done.
+        if self._vlrs.index_of("ExtraBytesVlr") != -1:
+            logger.warning(
+                "There is an ExtraByteVlr but the header.point_size matches the "
+                "point size without extra bytes. The extra bytes vlr info will be ignored"
+            )
+            self._vlrs.extract("ExtraBytesVlr")
+
     def _sync_extra_bytes_vlr(self) -> None:
-        try:
+        self._materialize_vlrs()
+        # The common case (no extra bytes vlr, e.g. any freshly
+        # constructed header) costs a single scan of the vlr list,
+        # no exception handling, no list rebuild.
+        if self._vlrs.index_of("ExtraBytesVlr") != -1:
             self._vlrs.extract("ExtraBytesVlr")
-        except IndexError:
-            pass
 
         extra_dimensions = list(self.point_format.extra_dimensions)
         if not extra_dimensions:
@@ -976,9 +1012,100 @@ class LasHeader:
         return f"<LasHeader({self.version.major}.{self.version.minor}, {self.point_format})>"
 
 
+def _read_header_extensions_1_3(header: LasHeader, stream: BinaryIO) -> None:
+    rec = np.frombuffer(
+        stream.read(LAS_HEADER_13_EXTENSION_DTYPE.itemsize),
+        dtype=LAS_HEADER_13_EXTENSION_DTYPE,
+    )[0]
+    header.start_of_waveform_data_packet_record = int(
+        rec["start_of_waveform_data_packet_record"]
+    )
+
+
+def _read_header_extensions_1_4(header: LasHeader, stream: BinaryIO) -> None:
+    _read_header_extensions_1_3(header, stream)
+    rec = np.frombuffer(
+        stream.read(LAS_HEADER_14_EXTENSION_DTYPE.itemsize),
+        dtype=LAS_HEADER_14_EXTENSION_DTYPE,
+    )[0]
+    header.start_of_first_evlr = int(rec["start_of_first_evlr"])
+    header.number_of_evlrs = int(rec["number_of_evlrs"])
+    header.point_count = int(rec["point_count"])
+    header.number_of_points_by_return[:] = rec["number_of_points_by_return"]
+
+
+#: Parsers for the fields a given version has
+#: after the common 1.2 layout
+LAS_HEADER_EXTENSION_READERS = {
+    "1.3": _read_header_extensions_1_3,
+    "1.4": _read_header_extensions_1_4,
+}
+
 LAS_HEADERS_SIZE = {
     "1.1": 227,
     "1.2": 227,
     "1.3": 235,
     "1.4": 375,
 }
+
+#: Layout of the fixed part of a LAS <= 1.2 header,
+#: the file signature excluded.
+LAS_HEADER_12_DTYPE = np.dtype(
+    [
+        ("file_source_id", "<u2"),
+        ("global_encoding", "<u2"),
+        ("uuid", "V16"),
+        ("version_major", "u1"),
+        ("version_minor", "u1"),
+        ("system_identifier", f"S{SYSTEM_IDENTIFIER_LEN}"),
+        ("generating_software", f"S{GENERATING_SOFTWARE_LEN}"),
+        ("creation_day_of_year", "<u2"),
+        ("creation_year", "<u2"),
+        ("header_size", "<u2"),
+        ("offset_to_point_data", "<u4"),
+        ("number_of_vlrs", "<u4"),
+        ("point_format_id", "u1"),
+        ("point_size", "<u2"),
+        ("point_count", "<u4"),
+        ("number_of_points_by_return", "<u4", (5,)),
+        ("scales", "<f8", (3,)),
+        ("offsets", "<f8", (3,)),
+        # x_max, x_min, y_max, y_min, z_max, z_min
+        ("max_min", "<f8", (6,)),
+    ]
+)
+
+#: Fields LAS 1.3 adds after the 1.2 ones
+LAS_HEADER_13_EXTENSION_DTYPE = np.dtype(
+    [("start_of_waveform_data_packet_record", "<u8")]
+)
+
+#: Fields LAS 1.4 adds after the 1.3 ones
+LAS_HEADER_14_EXTENSION_DTYPE = np.dtype(
+    [
+        ("start_of_first_evlr", "<u8"),
+        ("number_of_evlrs", "<u4"),
+        ("point_count", "<u8"),
+        ("number_of_points_by_return", "<u8", (15,)),
+    ]
+)
+
+#: For each version, the successive records making up
+#: the fixed part of the header (the file signature excluded)
+LAS_HEADER_PART_DTYPES = {
+    "1.1": (LAS_HEADER_12_DTYPE,),
+    "1.2": (LAS_HEADER_12_DTYPE,),
+    "1.3": (LAS_HEADER_12_DTYPE, LAS_HEADER_13_EXTENSION_DTYPE),
+    "1.4": (
+        LAS_HEADER_12_DTYPE,
+        LAS_HEADER_13_EXTENSION_DTYPE,
+        LAS_HEADER_14_EXTENSION_DTYPE,
+    ),
+}
+
+for _version_str, _part_dtypes in LAS_HEADER_PART_DTYPES.items():
+    assert (
+        len(LAS_FILE_SIGNATURE) + sum(dtype.itemsize for dtype in _part_dtypes)
+        == LAS_HEADERS_SIZE[_version_str]
+    )
+del _version_str, _part_dtypes
@@ -5,8 +5,9 @@ import copy
 import io
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Union
 
 from .compression import DecompressionSelection, LazBackend
 from .errors import LaspyException
@@ -254,6 +255,43 @@ def read_las(
         return reader.read()
 
 
+def read_headers(paths: Iterable, max_workers: Optional[int] = None) -> List[LasHeader]:
+    """Reads only the headers of several LAS/LAZ files, using a thread
+    pool.
+
+    This is meant for cataloguing workflows over many files, where only
+    metadata (point counts, extents, ...) is needed: the points are
+    never read, and as the VLR parsing is deferred, a bulk scan does not
+    pay for it either. Reading one header is dominated by two small
+    file reads, which release the GIL, so the threads mostly overlap IO.
+
+    >>> headers = read_headers(["tests/data/simple.las"] * 3)
+    >>> [header.point_count for header in headers]
+    [1065, 1065, 1065]
+
+    Parameters
+    ----------
+    paths : iterable of str or Path
+        The files whose header shall be read
+
+    max_workers : int, optional
+        The number of threads to use,
+        defaults to ThreadPoolExecutor's default
+
+    Returns
+    -------
+    list of laspy.LasHeader
+        The headers, in the order of the input paths
+    """
+
+    def read_header(path):
+        with open(path, mode="rb") as stream:
+            return LasHeader.read_from(stream)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_header, paths))
+
+
 def mmap_las(filename):
     """MMap a file, much like laspy did"""
     return LasMMAP(filename)
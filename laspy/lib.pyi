@@ -1,4 +1,4 @@
-from typing import BinaryIO, Iterable, Literal, Optional, Union, overload
+from typing import BinaryIO, Iterable, List, Literal, Optional, Union, overload
 
 from . import LasWriter, PointFormat
 from .compression import DecompressionSelection, LazBackend
@@ -63,6 +63,9 @@ def read_las(
     ] = LazBackend.detect_available(),
     decompression_selection: DecompressionSelection = DecompressionSelection.all(),
 ) -> LasData: ...
+def read_headers(
+    paths: Iterable[PathLike], max_workers: Optional[int] = ...
+) -> List[LasHeader]: ...
 def mmap_las(filename: PathLike) -> LasMMAP: ...
 def merge_las(las_files: Union[Iterable[LasData], LasData]) -> LasData: ...
 def create_las(
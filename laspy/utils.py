@@ -15,15 +15,12 @@ def encode_to_null_terminated(string: str, codec: str = "utf-8") -> bytes:
     return b
 
 
-def read_string(
-    stream: BinaryIO, length: int, encoding: str = "ascii "
-) -> Union[str, bytes]:
+def decode_string(raw_string: bytes, encoding: str = "ascii") -> Union[str, bytes]:
     """
-    Reads `length` bytes from the stream, and tries to decode it.
+    Trims the input at the first null byte and tries to decode it.
     If the decoding succeeds, returns the `str`. Otherwise the raw bytes
     are returned.
     """
-    raw_string = stream.read(length)
     first_null_byte_pos = raw_string.find(b"\0")
     if first_null_byte_pos >= 0:
         raw_string = raw_string[:first_null_byte_pos]
@@ -34,6 +31,17 @@ def read_string(
         return raw_string
 
 
+def read_string(
+    stream: BinaryIO, length: int, encoding: str = "ascii"
+) -> Union[str, bytes]:
+    """
+    Reads `length` bytes from the stream, and tries to decode it.
+    If the decoding succeeds, returns the `str`. Otherwise the raw bytes
+    are returned.
+    """
+    return decode_string(stream.read(length), encoding)
+
+
 def write_as_c_string(
     stream: BinaryIO,
     string: Union[str, bytes],
@@ -20,6 +20,17 @@ class VLRList(list):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    def index_of(self, vlr_type: str) -> int:
+        """Returns the index of the first vlr of the given type,
+        or -1 when the list contains no such vlr.
+
+        Unlike index, this never raises.
+        """
+        for i, vlr in enumerate(self):
+            if vlr.__class__.__name__ == vlr_type:
+                return i
+        return -1
+
     def index(self, value, start: int = 0, stop: int = None) -> int:
         if stop is None:
             stop = len(self)
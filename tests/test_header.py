@@ -52,6 +52,19 @@ def test_nb_points_return_1_4():
     )
 
 
+def test_read_headers():
+    paths = [test_common.simple_las, test_common.test1_4_las]
+
+    headers = laspy.read_headers(paths)
+
+    for header, path in zip(headers, paths):
+        expected = laspy.read(path).header
+        assert header.version == expected.version
+        assert header.point_count == expected.point_count
+        assert np.all(header.mins == expected.mins)
+        assert np.all(header.maxs == expected.maxs)
+
+
 def test_header_copy():
     las = laspy.read(test_common.simple_las)
     header_copy = copy.copy(las.header)
@@ -53,6 +53,26 @@ def test_adding_extra_bytes_vlr_by_hand():
     assert len(las.vlrs.get("ExtraBytesVlr")) == 0
 
 
+def test_vlr_changes_are_reflected_on_rewrite():
+    """
+    Test that modifying the VLR list between two writes
+    of the same file is reflected in the output.
+    """
+    simple = laspy.read(test_common.simple_las)
+
+    with io.BytesIO() as first_write:
+        simple.write(first_write)
+
+    classification_lookup = laspy.vlrs.known.ClassificationLookupVlr()
+    classification_lookup[20] = "computer"
+    simple.vlrs.append(classification_lookup)
+
+    las = test_common.write_then_read_again(simple)
+    lookups = las.vlrs.get("ClassificationLookupVlr")
+    assert len(lookups) == 1
+    assert lookups[0][20] == "computer"
+
+
 def test_geokey_parsing_does_not_require_optional_params():
     las = laspy.read(str(Path(__file__).parent / "data/simple1_3.las"))
     geo_keys = laspy.vlrs.geotiff.parse_geo_tiff_keys_from_vlrs(las.vlrs)